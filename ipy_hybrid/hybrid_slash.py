@@ -1,11 +1,14 @@
 import asyncio
+import functools
 import inspect
+import itertools
+import math
+import re
+import sys
 import typing
 
-import attrs
 import interactions as ipy
 from interactions.ext import prefixed_commands as prefixed
-from interactions.models.internal.converters import _LiteralConverter
 
 if typing.TYPE_CHECKING:
     from .context import HybridContext
@@ -13,6 +16,19 @@ if typing.TYPE_CHECKING:
 __all__ = ("HybridSlashCommand", "hybrid_slash_command", "hybrid_slash_subcommand")
 
 
+# bound once so comparisons don't have to go through the enum every time
+_OT_INT = ipy.OptionType.INTEGER
+_OT_NUMBER = ipy.OptionType.NUMBER
+_OT_CHANNEL = ipy.OptionType.CHANNEL
+
+_BOOL_MAP: dict[str, bool] = {
+    s: True for s in ("yes", "y", "true", "t", "1", "enable", "on")
+} | {s: False for s in ("no", "n", "false", "f", "0", "disable", "off")}
+
+# user mention, role mention, raw id - matches what the ipy converters accept
+_MENTION_RE = re.compile(r"<@!?([0-9]{15,})>$|<@&([0-9]{15,})>$|([0-9]{15,})$")
+
+
 def _values_wrapper(a_dict: dict | None):
     return list(a_dict.values()) if a_dict else []
 
@@ -27,15 +43,12 @@ class BasicConverter(ipy.Converter):
 
 class BoolConverter(ipy.Converter):
     async def convert(self, ctx: ipy.BaseContext, argument: str) -> bool:
-        lowered = argument.lower()
-        if lowered in {"yes", "y", "true", "t", "1", "enable", "on"}:
-            return True
-        elif lowered in {"no", "n", "false", "f", "0", "disable", "off"}:
-            return False
-        else:
+        try:
+            return _BOOL_MAP[argument.lower()]
+        except KeyError:
             raise ipy.errors.BadArgument(
                 f"{argument} is not a recognised boolean option."
-            )
+            ) from None
 
 
 class AttachmentConverter(ipy.NoArgumentConverter):
@@ -48,19 +61,22 @@ class AttachmentConverter(ipy.NoArgumentConverter):
             raise ipy.errors.BadArgument("No attachment found.") from None
 
 
-class ChoicesConverter(_LiteralConverter):
+class ChoicesConverter(ipy.Converter):
     def __init__(self, choices: list[ipy.SlashCommandChoice | dict]) -> None:
         standardized_choices = tuple(
             (ipy.SlashCommandChoice(**o) if isinstance(o, dict) else o) for o in choices
         )
-
-        names = tuple(c.name for c in standardized_choices)
-        self.values = {str(arg): str for arg in names}
         self.choice_values = {str(c.name): c.value for c in standardized_choices}
 
     async def convert(self, ctx: ipy.BaseContext, argument: str) -> typing.Any:
-        val = await super().convert(ctx, argument)
-        return self.choice_values[val]
+        try:
+            return self.choice_values[argument]
+        except KeyError:
+            choices_list = list(self.choice_values)
+            choices_str = ", ".join(choices_list[:-1]) + f", or {choices_list[-1]}"
+            raise ipy.errors.BadArgument(
+                f'Could not convert "{argument}" into one of {choices_str}.'
+            ) from None
 
 
 class RangeConverter(ipy.Converter[float | int]):
@@ -74,28 +90,33 @@ class RangeConverter(ipy.Converter[float | int]):
         self.min_value = min_value
         self.max_value = max_value
 
-        self.number_convert = int if number_type == ipy.OptionType.INTEGER else float
+        # None means unbounded - 0 is a perfectly valid bound
+        self._lo = min_value if min_value is not None else -math.inf
+        self._hi = max_value if max_value is not None else math.inf
+
+        self.number_convert = int if number_type == _OT_INT else float
 
     async def convert(self, ctx: ipy.BaseContext, argument: str) -> float | int:
         try:
-            converted: float | int = await ipy.utils.maybe_coroutine(
-                self.number_convert, ctx, argument
-            )
-
-            if self.min_value and converted < self.min_value:
+            converted: float | int = self.number_convert(argument)
+
+            if not (self._lo <= converted <= self._hi):
+                if converted < self._lo:
+                    raise ipy.errors.BadArgument(
+                        f'Value "{argument}" is less than {self.min_value}.'
+                    )
+                if converted > self._hi:
+                    raise ipy.errors.BadArgument(
+                        f'Value "{argument}" is greater than {self.max_value}.'
+                    )
+                # only nan compares false against both bounds
                 raise ipy.errors.BadArgument(
-                    f'Value "{argument}" is less than {self.min_value}.'
-                )
-            if self.max_value and converted > self.max_value:
-                raise ipy.errors.BadArgument(
-                    f'Value "{argument}" is greater than {self.max_value}.'
+                    f'Value "{argument}" is not a valid number.'
                 )
 
             return converted
         except ValueError:
-            type_name = (
-                "number" if self.number_type == ipy.OptionType.NUMBER else "integer"
-            )
+            type_name = "number" if self.number_type == _OT_NUMBER else "integer"
 
             if type_name.startswith("i"):
                 raise ipy.errors.BadArgument(
@@ -116,13 +137,17 @@ class StringLengthConverter(ipy.Converter[str]):
         self.min_length = min_length
         self.max_length = max_length
 
+        self._lo = min_length if min_length is not None else 0
+        self._hi = max_length if max_length is not None else sys.maxsize
+
     async def convert(self, ctx: ipy.BaseContext, argument: str) -> str:
-        if self.min_length and len(argument) < self.min_length:
-            raise ipy.errors.BadArgument(
-                f'The string "{argument}" is shorter than'
-                f" {self.min_length} character(s)."
-            )
-        elif self.max_length and len(argument) > self.max_length:
+        length = len(argument)
+        if not (self._lo <= length <= self._hi):
+            if length < self._lo:
+                raise ipy.errors.BadArgument(
+                    f'The string "{argument}" is shorter than'
+                    f" {self.min_length} character(s)."
+                )
             raise ipy.errors.BadArgument(
                 f'The string "{argument}" is longer than'
                 f" {self.max_length} character(s)."
@@ -132,8 +157,8 @@ class StringLengthConverter(ipy.Converter[str]):
 
 
 class NarrowedChannelConverter(ipy.BaseChannelConverter):
-    def __init__(self, channel_types: list[ipy.ChannelType | int]) -> None:
-        self.channel_types = channel_types
+    def __init__(self, channel_types: typing.Iterable[ipy.ChannelType | int]) -> None:
+        self.channel_types = frozenset(channel_types)
 
     def _check(self, result: ipy.BaseChannel) -> bool:
         return result.type in self.channel_types
@@ -142,92 +167,190 @@ class NarrowedChannelConverter(ipy.BaseChannelConverter):
 class HackyUnionConverter(ipy.Converter):
     def __init__(self, *converters: type[ipy.Converter]) -> None:
         self.converters = converters
+        # converters are stateless, so there's no need to make new ones every call
+        self._converter_instances = tuple(c() for c in converters)
 
-    async def convert(self, ctx: ipy.BaseContext, arg: str) -> typing.Any:
-        for converter in self.converters:
-            try:
-                return await converter().convert(ctx, arg)
-            except Exception:
-                continue
-
+    def _bad_argument(self, arg: str) -> ipy.errors.BadArgument:
         union_names = tuple(
             ipy.utils.get_object_name(t).removesuffix("Converter")
             for t in self.converters
         )
         union_types_str = ", ".join(union_names[:-1]) + f", or {union_names[-1]}"
-        raise ipy.errors.BadArgument(
+        return ipy.errors.BadArgument(
             f'Could not convert "{arg}" into {union_types_str}.'
         )
 
+    async def convert(self, ctx: ipy.BaseContext, arg: str) -> typing.Any:
+        for converter in self._converter_instances:
+            try:
+                return await converter.convert(ctx, arg)
+            except Exception:
+                continue
+
+        raise self._bad_argument(arg)
+
+
+# the fast paths below treat http errors as "not found", just like the
+# try/except chain in HackyUnionConverter does
+
+
+async def _fetch_member_or_user(
+    ctx: ipy.BaseContext, user_id: int
+) -> ipy.Member | ipy.User | None:
+    if ctx.guild:
+        try:
+            if member := await ctx.guild.fetch_member(user_id):
+                return member
+        except ipy.errors.HTTPException:
+            pass
+
+    try:
+        return await ctx.bot.fetch_user(user_id)
+    except ipy.errors.HTTPException:
+        return None
+
+
+async def _fetch_role(ctx: ipy.BaseContext, role_id: int) -> ipy.Role | None:
+    if not ctx.guild:
+        return None
+
+    try:
+        return await ctx.guild.fetch_role(role_id)
+    except ipy.errors.HTTPException:
+        return None
+
+
+class UserUnionConverter(HackyUnionConverter):
+    def __init__(self) -> None:
+        super().__init__(ipy.MemberConverter, ipy.UserConverter)
+
+    async def convert(self, ctx: ipy.BaseContext, arg: str) -> ipy.Member | ipy.User:
+        match = _MENTION_RE.match(arg)
+        if not match or match[2]:
+            # names and the like - let the converters sort it out
+            return await super().convert(ctx, arg)
+
+        if result := await _fetch_member_or_user(ctx, int(match[1] or match[3])):
+            return result
+        raise self._bad_argument(arg)
+
+
+class MentionableUnionConverter(HackyUnionConverter):
+    def __init__(self) -> None:
+        super().__init__(ipy.MemberConverter, ipy.UserConverter, ipy.RoleConverter)
+
+    async def convert(
+        self, ctx: ipy.BaseContext, arg: str
+    ) -> ipy.Member | ipy.User | ipy.Role:
+        match = _MENTION_RE.match(arg)
+        if not match:
+            return await super().convert(ctx, arg)
+
+        user_mention, role_mention, raw_id = match.groups()
+        result = None
+
+        if not role_mention:
+            result = await _fetch_member_or_user(ctx, int(user_mention or raw_id))
+        if not result and not user_mention:
+            result = await _fetch_role(ctx, int(role_mention or raw_id))
+
+        if not result:
+            raise self._bad_argument(arg)
+        return result
+
+
+def _resolve_converter_function(
+    converter: type[ipy.Converter] | ipy.Converter | typing.Callable, name: str
+) -> typing.Callable:
+    # parameters already store the result of _get_converter_function (a bound
+    # convert method), so only actual converter classes/instances need resolving
+    if hasattr(converter, "convert"):
+        return ipy.BaseCommand._get_converter_function(converter, name)
+    return converter
+
 
 class ChainConverter(ipy.Converter):
     def __init__(
         self,
         first_converter: ipy.Converter,
-        second_converter: type[ipy.Converter] | ipy.Converter,
+        second_converter: type[ipy.Converter] | ipy.Converter | typing.Callable,
         name_of_cmd: str,
     ) -> None:
         self.first_converter = first_converter
         self.second_converter = second_converter
         self.name_of_cmd = name_of_cmd
 
+        self._second_fn = _resolve_converter_function(second_converter, name_of_cmd)
+        # figured out now so that conversions don't need maybe_coroutine
+        self._second_is_async = inspect.iscoroutinefunction(self._second_fn)
+
     async def convert(self, ctx: ipy.BaseContext, arg: str) -> typing.Any:
         first = await self.first_converter.convert(ctx, arg)
-        return await ipy.utils.maybe_coroutine(
-            ipy.BaseCommand._get_converter_function(
-                self.second_converter, self.name_of_cmd
-            )(ctx, first)
-        )
+        if self._second_is_async:
+            return await self._second_fn(ctx, first)
+        return self._second_fn(ctx, first)
 
 
 class ChainNoArgConverter(ipy.NoArgumentConverter):
     def __init__(
         self,
         first_converter: ipy.NoArgumentConverter,
-        second_converter: type[ipy.Converter] | ipy.Converter,
+        second_converter: type[ipy.Converter] | ipy.Converter | typing.Callable,
         name_of_cmd: str,
     ) -> None:
         self.first_converter = first_converter
         self.second_converter = second_converter
         self.name_of_cmd = name_of_cmd
 
+        self._second_fn = _resolve_converter_function(second_converter, name_of_cmd)
+        # figured out now so that conversions don't need maybe_coroutine
+        self._second_is_async = inspect.iscoroutinefunction(self._second_fn)
+
     async def convert(self, ctx: "HybridContext", _: typing.Any) -> typing.Any:
         first = await self.first_converter.convert(ctx, _)
-        return await ipy.utils.maybe_coroutine(
-            ipy.BaseCommand._get_converter_function(
-                self.second_converter, self.name_of_cmd
-            )(ctx, first)
-        )
+        if self._second_is_async:
+            return await self._second_fn(ctx, first)
+        return self._second_fn(ctx, first)
+
+
+# none of these converters store per-call state on themselves
+# (AttachmentConverter keeps its index on the context), so one instance
+# per option type can be shared between every command
+_CONVERTER_SINGLETONS: dict[ipy.OptionType | int, ipy.Converter] = {
+    ipy.OptionType.STRING: BasicConverter(str),
+    ipy.OptionType.INTEGER: BasicConverter(int),
+    ipy.OptionType.NUMBER: BasicConverter(float),
+    ipy.OptionType.BOOLEAN: BoolConverter(),
+    ipy.OptionType.USER: UserUnionConverter(),
+    ipy.OptionType.CHANNEL: ipy.BaseChannelConverter(),
+    ipy.OptionType.ROLE: ipy.RoleConverter(),
+    ipy.OptionType.MENTIONABLE: MentionableUnionConverter(),
+    ipy.OptionType.ATTACHMENT: AttachmentConverter(),
+}
 
 
 def type_from_option(option_type: ipy.OptionType | int) -> ipy.Converter:
-    if option_type == ipy.OptionType.STRING:
-        return BasicConverter(str)
-    elif option_type == ipy.OptionType.INTEGER:
-        return BasicConverter(int)
-    elif option_type == ipy.OptionType.NUMBER:
-        return BasicConverter(float)
-    elif option_type == ipy.OptionType.BOOLEAN:
-        return BoolConverter()
-    elif option_type == ipy.OptionType.USER:
-        return HackyUnionConverter(ipy.MemberConverter, ipy.UserConverter)
-    elif option_type == ipy.OptionType.CHANNEL:
-        return ipy.BaseChannelConverter()
-    elif option_type == ipy.OptionType.ROLE:
-        return ipy.RoleConverter()
-    elif option_type == ipy.OptionType.MENTIONABLE:
-        return HackyUnionConverter(
-            ipy.MemberConverter, ipy.UserConverter, ipy.RoleConverter
-        )
-    elif option_type == ipy.OptionType.ATTACHMENT:
-        return AttachmentConverter()
-    raise NotImplementedError(f"Unknown option type: {option_type}")
+    try:
+        return _CONVERTER_SINGLETONS[option_type]
+    except KeyError:
+        raise NotImplementedError(f"Unknown option type: {option_type}") from None
 
 
-@attrs.define(eq=False, order=False, hash=False, kw_only=True)
 class HybridSlashCommand(ipy.SlashCommand):
+    # no new fields, so there's no need to have attrs regenerate __init__
+    __slots__ = ()
+
+    def __attrs_post_init__(self) -> None:
+        super().__attrs_post_init__()
+        # normalize dict options once here so slash_to_prefixed doesn't have to
+        # this stays a list - slash_option and friends insert into it later on
+        self.options = [
+            (ipy.SlashCommandOption(**o) if isinstance(o, dict) else o)
+            for o in self.options or ()
+        ]
+
     async def __call__(self, context: ipy.SlashContext, *args, **kwargs) -> None:
-        new_ctx = context.client.hybrid.hybrid_context.from_slash_context(context)
+        new_ctx = context.client.hybrid._from_slash(context)
         await super().__call__(new_ctx, *args, **kwargs)
 
     def group(
@@ -286,21 +409,23 @@ class HybridSlashCommand(ipy.SlashCommand):
         return wrapper
 
 
-@attrs.define(eq=False, order=False, hash=False, kw_only=True)
 class _HybridToPrefixedCommand(prefixed.PrefixedCommand):
+    __slots__ = ()
+
     async def __call__(
         self, context: prefixed.PrefixedContext, *args, **kwargs
     ) -> None:
-        new_ctx = context.client.hybrid.hybrid_context.from_prefixed_context(context)
+        new_ctx = context.client.hybrid._from_prefixed(context)
         await super().__call__(new_ctx, *args, **kwargs)
 
 
 def slash_to_prefixed(cmd: ipy.SlashCommand) -> _HybridToPrefixedCommand:
+    cmd_name = cmd.sub_cmd_name if cmd.is_subcommand else cmd.name
+
     prefixed_cmd = _HybridToPrefixedCommand(
-        name=str(cmd.sub_cmd_name) if cmd.is_subcommand else str(cmd.name),
-        aliases=list(_values_wrapper(cmd.sub_cmd_name.to_locale_dict()))
-        if cmd.is_subcommand
-        else list(_values_wrapper(cmd.name.to_locale_dict())),
+        name=str(cmd_name),
+        # aliases gets mutated by the prefixed manager, so this has to be a list
+        aliases=_values_wrapper(cmd_name.to_locale_dict()),
         help=str(cmd.description),
         callback=cmd.callback,
         checks=cmd.checks,
@@ -311,74 +436,139 @@ def slash_to_prefixed(cmd: ipy.SlashCommand) -> _HybridToPrefixedCommand:
         error_callback=cmd.error_callback,
     )
 
+    # parameters are almost always declared in the same order as the options,
+    # so walk them side by side and only look a parameter up on a mismatch
+    param_items = itertools.chain(
+        cmd.parameters.items(), itertools.repeat((None, None))
+    )
     fake_sig_parameters: list[inspect.Parameter] = []
 
-    for option in cmd.options:
-        if isinstance(option, dict):
-            # makes my life easier
-            option = ipy.SlashCommandOption(**option)
+    for option, (param_name, slash_param) in zip(cmd.options, param_items):
+        name = str(option.name)
+        if param_name != name:
+            slash_param = cmd.parameters.get(name)
+        fake_sig_parameters.append(_option_to_parameter(option, name, slash_param))
+
+    # every parameter is keyword-only with a unique name, so there's nothing for
+    # Signature to validate
+    prefixed_cmd._inspect_signature = inspect.Signature(
+        parameters=fake_sig_parameters, __validate_parameters__=False
+    )
+    return prefixed_cmd
 
-        if option.autocomplete:
-            # there isn't much we can do here
-            raise ValueError("Cannot use autocomplete in hybrid commands.")
 
-        name = str(option.name)
-        annotation = inspect.Parameter.empty
-        default = inspect.Parameter.empty
-
-        if slash_param := cmd.parameters.get(name):
-            if slash_param.converter:
-                annotation = slash_param.converter
-            if slash_param.default is not ipy.MISSING:
-                default = slash_param.default
-
-        if option.choices:
-            option_anno = ChoicesConverter(option.choices)
-        elif option.min_value is not None or option.max_value is not None:
-            option_anno = RangeConverter(
-                option.type, option.min_value, option.max_value
-            )
-        elif option.min_length is not None or option.max_length is not None:
-            option_anno = StringLengthConverter(option.min_length, option.max_length)
-        elif option.type == ipy.OptionType.CHANNEL and option.channel_types:
-            option_anno = NarrowedChannelConverter(option.channel_types)
-        else:
-            option_anno = type_from_option(option.type)
-
-        if annotation is inspect.Parameter.empty:
-            annotation = option_anno
-        elif isinstance(option_anno, ipy.NoArgumentConverter):
-            annotation = ChainNoArgConverter(option_anno, annotation, name)
-        else:
-            annotation = ChainConverter(option_anno, annotation, name)
-
-        if not option.required and default == inspect.Parameter.empty:
-            default = None
-
-        actual_param = inspect.Parameter(
-            name=name,
-            kind=inspect.Parameter.KEYWORD_ONLY,
-            default=default,
-            annotation=annotation,
+def _option_to_parameter(
+    option: ipy.SlashCommandOption,
+    name: str,
+    slash_param: typing.Optional[ipy.SlashCommandParameter],
+) -> inspect.Parameter:
+    if option.autocomplete:
+        # there isn't much we can do here
+        raise ValueError("Cannot use autocomplete in hybrid commands.")
+
+    annotation = inspect.Parameter.empty
+    default = inspect.Parameter.empty
+
+    if slash_param:
+        if param_converter := slash_param.converter:
+            annotation = param_converter
+        if (param_default := slash_param.default) is not ipy.MISSING:
+            default = param_default
+
+    option_anno = _option_converter(option)
+
+    if annotation is inspect.Parameter.empty:
+        annotation = option_anno
+    elif isinstance(option_anno, ipy.NoArgumentConverter):
+        annotation = ChainNoArgConverter(option_anno, annotation, name)
+    else:
+        annotation = ChainConverter(option_anno, annotation, name)
+
+    if not option.required and default == inspect.Parameter.empty:
+        default = None
+
+    return inspect.Parameter(
+        name=name,
+        kind=inspect.Parameter.KEYWORD_ONLY,
+        default=default,
+        annotation=annotation,
+    )
+
+
+def _option_converter(option: ipy.SlashCommandOption) -> ipy.Converter:
+    choices = None
+    if option_choices := option.choices:
+        standardized_choices = (
+            (ipy.SlashCommandChoice(**c) if isinstance(c, dict) else c)
+            for c in option_choices
+        )
+        # the types are included so that, say, 1 and True don't share a cache entry
+        choices = tuple(
+            (str(c.name), type(c.value), c.value) for c in standardized_choices
         )
-        fake_sig_parameters.append(actual_param)
 
-    prefixed_cmd._inspect_signature = inspect.Signature(parameters=fake_sig_parameters)
-    return prefixed_cmd
+    channel_types = option.channel_types
+
+    # only option data goes in here - nothing from the command itself, so the
+    # cache never holds onto objects from unloaded extensions
+    option_key = (
+        option.type,
+        option.min_value,
+        option.max_value,
+        option.min_length,
+        option.max_length,
+        choices,
+        tuple(channel_types) if channel_types else None,
+    )
 
+    try:
+        hash(option_key)
+    except TypeError:
+        # can't be cached, so just make a new converter
+        return _build_option_converter.__wrapped__(option_key)
+    return _build_option_converter(option_key)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_option_converter(option_key: tuple) -> ipy.Converter:
+    # options with the same shape get the same converter, so reloads (and
+    # commands with identical options) can just reuse the old one
+    (
+        option_type,
+        min_value,
+        max_value,
+        min_length,
+        max_length,
+        choices,
+        channel_types,
+    ) = option_key
+
+    if choices:
+        return ChoicesConverter(
+            [ipy.SlashCommandChoice(name=n, value=v) for n, _, v in choices]
+        )
+    elif min_value is not None or max_value is not None:
+        return RangeConverter(option_type, min_value, max_value)
+    elif min_length is not None or max_length is not None:
+        return StringLengthConverter(min_length, max_length)
+    elif option_type == _OT_CHANNEL and channel_types:
+        return NarrowedChannelConverter(channel_types)
+    return type_from_option(option_type)
+
+
+async def _subcommand_base_group(*args, **kwargs) -> None:
+    raise ipy.errors.BadArgument(
+        "Cannot run this subcommand group without a valid subcommand."
+    )
 
-def create_subcmd_func(group: bool = False) -> typing.Callable:
-    async def _subcommand_base(*args, **kwargs) -> None:
-        if group:
-            raise ipy.errors.BadArgument(
-                "Cannot run this subcommand group without a valid subcommand."
-            )
-        else:
-            raise ipy.errors.BadArgument(
-                "Cannot run this command without a valid subcommand."
-            )
 
-    return _subcommand_base
+async def _subcommand_base_cmd(*args, **kwargs) -> None:
+    raise ipy.errors.BadArgument("Cannot run this command without a valid subcommand.")
+
+
+def create_subcmd_func(group: bool = False) -> typing.Callable:
+    # there's only ever two possible functions, so they can just be shared
+    return _subcommand_base_group if group else _subcommand_base_cmd
 
 
 def base_subcommand_generator(
@@ -24,6 +24,9 @@ class HybridManager:
 
         self.client = typing.cast(prefixed.PrefixedInjectedClient, client)
         self.hybrid_context = hybrid_context
+        # looked up on every single hybrid command invocation
+        self._from_slash = hybrid_context.from_slash_context
+        self._from_prefixed = hybrid_context.from_prefixed_context
         self.ext_command_list: dict[str, list[str]] = {}
 
         self.client.add_listener(self.on_callback_added.copy_with_binding(self))
@@ -40,26 +43,29 @@ class HybridManager:
             return
 
         cmd = event.callback
+        prefixed_manager = self.client.prefixed
         prefixed_transform = slash_to_prefixed(cmd)
 
         if cmd.is_subcommand:
-            base = None
-            if not (base := self.client.prefixed.commands.get(str(cmd.name))):
+            base_name = str(cmd.name)
+            base = prefixed_manager.commands.get(base_name)
+            if base is None:
                 base = base_subcommand_generator(
-                    str(cmd.name),
-                    list(_values_wrapper(cmd.name.to_locale_dict())),
-                    str(cmd.name),
+                    base_name,
+                    _values_wrapper(cmd.name.to_locale_dict()),
+                    base_name,
                     group=False,
                 )
-                self.client.prefixed.add_command(base)
+                prefixed_manager.add_command(base)
 
             if cmd.group_name:  # group command
-                group = None
-                if not (group := base.subcommands.get(str(cmd.group_name))):
+                group_name = str(cmd.group_name)
+                group = base.subcommands.get(group_name)
+                if group is None:
                     group = base_subcommand_generator(
-                        str(cmd.group_name),
-                        list(_values_wrapper(cmd.group_name.to_locale_dict())),
-                        str(cmd.group_name),
+                        group_name,
+                        _values_wrapper(cmd.group_name.to_locale_dict()),
+                        group_name,
                         group=True,
                     )
                     base.add_command(group)
@@ -67,7 +73,7 @@ class HybridManager:
 
             base.add_command(prefixed_transform)
         else:
-            self.client.prefixed.add_command(prefixed_transform)
+            prefixed_manager.add_command(prefixed_transform)
 
         if cmd.extension:
             self.ext_command_list.setdefault(cmd.extension.extension_name, []).append(